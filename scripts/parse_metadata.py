@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 def main() -> int:
     if len(sys.argv) != 2:
@@ -13,11 +17,11 @@ def main() -> int:
 
     path = Path(sys.argv[1])
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _json.loads(path.read_bytes())
     except FileNotFoundError:
         print(f"Metadata file not found: {path}", file=sys.stderr)
         return 1
-    except json.JSONDecodeError:
+    except ValueError:
         print(f"Failed to parse metadata JSON. Check {path} format.", file=sys.stderr)
         return 1
 
@@ -8,42 +8,183 @@ with the coffincolors/winlator CMOD application by simulating the
 key validation steps that Winlator performs during container startup.
 """
 
-import json
+import functools
+import io
+import operator
 import os
 import re
+import stat
 import subprocess
 import sys
 import tarfile
 import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# tarfile copies member data in 16 KiB chunks by default; a 1 MiB buffer
+# cuts the per-file read/write round-trips on large wine prefixes.
+_COPY_BUFSIZE = 1 << 20
+
+
+def _stat_kind(path) -> str:
+    """
+    Classify a path as 'dir', 'file', 'other', or 'missing' with a single
+    stat call (pathlib's exists()+is_dir() chain issues two).
+    """
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except OSError:
+        return 'missing'
+    if stat.S_ISDIR(st.st_mode):
+        return 'dir'
+    if stat.S_ISREG(st.st_mode):
+        return 'file'
+    return 'other'
+
+
+def _batch_read_io_uring(paths: List[str]) -> Dict[str, bytes]:
+    """Read files by submitting all reads as a single io_uring batch."""
+    results = {}
+    opened = []
+    buffers = []
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(max(len(paths), 1), ring)
+    try:
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            size = os.fstat(fd).st_size
+            buf = bytearray(size)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buf, size, 0)
+            sqe.user_data = len(opened)
+            opened.append((path, fd))
+            buffers.append(buf)
+
+        if opened:
+            liburing.io_uring_submit(ring)
+            cqe = liburing.io_uring_cqe()
+            for _ in range(len(opened)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                idx = cqe.user_data
+                if cqe.res >= 0:
+                    results[opened[idx][0]] = bytes(buffers[idx][:cqe.res])
+                liburing.io_uring_cqe_seen(ring, cqe)
+    finally:
+        for _, fd in opened:
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
+    return results
+
+
+def _batch_read_small_files(paths: List[str]) -> Dict[str, bytes]:
+    """
+    Read several small files at once, returning {path: contents}.
+
+    When liburing is available on Linux and WCP_TEST_IO_URING is set, the
+    reads are submitted as one io_uring batch so syscall and device latency
+    overlap; otherwise they fall back to sequential reads. Missing or
+    unreadable files are simply omitted from the result.
+    """
+    if liburing is not None and sys.platform == 'linux' and os.environ.get('WCP_TEST_IO_URING'):
+        try:
+            return _batch_read_io_uring(paths)
+        except Exception:
+            pass  # fall through to the sequential path
+
+    results = {}
+    for path in paths:
+        try:
+            results[path] = Path(path).read_bytes()
+        except OSError:
+            pass
+    return results
+
+
+@functools.lru_cache(maxsize=256)
+def _construct_identifier(type_name: str, version_name: str) -> str:
+    """Build a WineInfo identifier, caching results across repeat calls."""
+    prefix = type_name.lower() + '-'
+
+    # If versionName already includes the type prefix, use it directly;
+    # otherwise prepend the type (lowercased)
+    return version_name if version_name.startswith(prefix) else prefix + version_name
+
 
 class WineInfoValidator:
     """
     Validates Wine/Proton identifiers based on WineInfo.java regex pattern.
     Pattern: ^(wine|proton|Proton)\\-([0-9\\.]+)\\-?([0-9\\.]+)?\\-(x86|x86_64|arm64ec)$
     """
-    
-    PATTERN = re.compile(r'^(wine|proton|Proton)\-([0-9\.]+)\-?([0-9\.]+)?\-(x86|x86_64|arm64ec)$')
-    
+
+    # Kept as the reference grammar (also quoted in error messages); the
+    # actual parse below is hand-rolled since the grammar is trivial.
+    PATTERN = re.compile(r'^(wine|proton|Proton)-([0-9.]+)-?([0-9.]+)?-(x86|x86_64|arm64ec)$', re.ASCII)
+    _TYPE_MAP = {'wine': 'wine', 'proton': 'proton', 'Proton': 'proton'}
+    _ARCHS = frozenset(('x86', 'x86_64', 'arm64ec'))
+    _VERSION_CHARS = frozenset('0123456789.')
+
     @classmethod
     def validate_identifier(cls, identifier: str) -> Tuple[bool, Optional[Dict[str, str]]]:
         """
         Validate a wine/proton identifier against the WineInfo pattern.
-        
+
+        The grammar is a literal type, dashed digit-dot version segments,
+        and a literal arch, so a split-based parse avoids the regex engine
+        dispatch entirely while matching PATTERN exactly.
+
         Returns:
             (is_valid, parsed_data) where parsed_data contains type, version, subversion, arch
         """
-        match = cls.PATTERN.match(identifier)
-        if not match:
+        parts = identifier.split('-')
+        if not 3 <= len(parts) <= 4:
+            return False, None
+
+        type_name = parts[0]
+        arch = parts[-1]
+        if type_name not in cls._TYPE_MAP or arch not in cls._ARCHS:
+            return False, None
+
+        version = parts[1]
+        if not version or not cls._VERSION_CHARS.issuperset(version):
             return False, None
-        
+
+        subversion = parts[2] if len(parts) == 4 else None
+        if subversion:
+            if not cls._VERSION_CHARS.issuperset(subversion):
+                return False, None
+        else:
+            # The regex's optional subversion group reports empty as None
+            subversion = None
+
         return True, {
-            'type': match.group(1).lower(),  # wine or proton
-            'version': match.group(2),
-            'subversion': match.group(3) if match.group(3) else None,
-            'arch': match.group(4)
+            'type': cls._TYPE_MAP[type_name],  # wine or proton
+            'version': version,
+            'subversion': subversion,
+            'arch': arch
         }
     
     @classmethod
@@ -52,15 +193,11 @@ class WineInfoValidator:
         Construct a WineInfo identifier from type and versionName.
         This mimics how Winlator resolves identifiers from profile.json.
         Note: Type is normalized to lowercase as per WineInfo.fromIdentifier behavior.
+
+        The profile is checked and then logged with the same arguments, so
+        the work is memoized in module-level _construct_identifier.
         """
-        type_lower = type_name.lower()
-        
-        # If versionName already includes the type prefix, use it directly
-        if version_name.startswith(f"{type_lower}-"):
-            return version_name
-        
-        # Otherwise, prepend the type (lowercased)
-        return f"{type_lower}-{version_name}"
+        return _construct_identifier(type_name, version_name)
 
 
 class ContentProfileValidator:
@@ -70,440 +207,791 @@ class ContentProfileValidator:
     
     REQUIRED_FIELDS = ['type', 'versionName', 'versionCode', 'description', 'files']
     VALID_TYPES = ['Wine', 'Proton', 'DXVK', 'VKD3D', 'Box64', 'WOWBox64', 'FEXCore']
-    
+    _VALID_TYPES = frozenset(VALID_TYPES)
+
     @classmethod
     def validate_profile(cls, profile_data: dict) -> Tuple[bool, List[str]]:
         """
         Validate profile.json structure matches Winlator expectations.
-        
+
         Returns:
             (is_valid, error_messages)
         """
+        if _schema_validate is None:
+            return cls._validate_profile_explicit(profile_data)
+
+        # Fast path: the compiled schema accepts or rejects in one call.
+        # On rejection, re-run the explicit checks so callers get every
+        # problem in the canonical wording - the schema raises only its
+        # first error, phrased differently - and the verdict can never
+        # depend on whether the optional dependency is installed.
+        try:
+            _schema_validate(profile_data)
+        except fastjsonschema.JsonSchemaException:
+            return cls._validate_profile_explicit(profile_data)
+
+        errors = []
+        cls._check_version_name(profile_data['type'], profile_data.get('versionName', ''), errors)
+        return len(errors) == 0, errors
+
+    @classmethod
+    def _validate_profile_explicit(cls, profile_data: dict) -> Tuple[bool, List[str]]:
+        """Hand-rolled checks; the source of truth for verdicts and wording."""
         errors = []
-        
+
         # Check required fields
-        for field in cls.REQUIRED_FIELDS:
-            if field not in profile_data:
-                errors.append(f"Missing required field: {field}")
-        
+        for field_name in cls.REQUIRED_FIELDS:
+            if field_name not in profile_data:
+                errors.append(f"Missing required field: {field_name}")
+
         if errors:
             return False, errors
-        
+
+        # Bind each value once; all checks below run against the locals.
+        get = profile_data.get
+        profile_type = get('type')
+        version_code = get('versionCode')
+        files = get('files')
+        version_name = get('versionName', '')
+
         # Validate type
-        profile_type = profile_data.get('type')
-        if profile_type not in cls.VALID_TYPES:
+        if profile_type not in cls._VALID_TYPES:
             errors.append(f"Invalid type '{profile_type}'. Must be one of: {', '.join(cls.VALID_TYPES)}")
-        
-        # Validate versionCode is integer
-        try:
-            int(profile_data.get('versionCode'))
-        except (ValueError, TypeError):
-            errors.append(f"versionCode must be an integer, got: {profile_data.get('versionCode')}")
-        
+
+        # Validate versionCode is integer (pre-check the type so the
+        # common good case never pays for the exception path)
+        if not isinstance(version_code, (int, float, str)):
+            errors.append(f"versionCode must be an integer, got: {version_code}")
+        else:
+            try:
+                int(version_code)
+            except ValueError:
+                errors.append(f"versionCode must be an integer, got: {version_code}")
+
         # Validate files is an array
-        if not isinstance(profile_data.get('files'), list):
-            errors.append(f"files must be an array, got: {type(profile_data.get('files'))}")
-        
+        if type(files) is not list:
+            errors.append(f"files must be an array, got: {type(files)}")
+
         # Type-specific validation
-        if profile_type in ['Wine', 'Proton']:
-            if profile_type == 'Wine':
-                required_section = 'wine'
-                required_keys = ['binPath', 'libPath', 'prefixPack']
-            else:  # Proton
-                required_section = 'proton'
-                required_keys = ['binPath', 'libPath', 'prefixPack']
-            
+        if profile_type in ('Wine', 'Proton'):
+            required_section = 'wine' if profile_type == 'Wine' else 'proton'
+
             if required_section not in profile_data:
                 errors.append(f"Missing required section: {required_section}")
             else:
                 section_data = profile_data[required_section]
-                for key in required_keys:
+                for key in ('binPath', 'libPath', 'prefixPack'):
                     if key not in section_data:
                         errors.append(f"Missing {required_section}.{key}")
-        
-        # Validate versionName format for Wine/Proton types
-        if profile_type in ['Wine', 'Proton']:
-            version_name = profile_data.get('versionName', '')
-            
-            # Construct the identifier as Winlator would
-            identifier = WineInfoValidator.construct_identifier(profile_type, version_name)
-            
-            is_valid, parsed = WineInfoValidator.validate_identifier(identifier)
-            if not is_valid:
+
+        cls._check_version_name(profile_type, version_name, errors)
+
+        return len(errors) == 0, errors
+
+    @classmethod
+    def _check_version_name(cls, profile_type, version_name, errors: List[str]) -> None:
+        """
+        Validate versionName format for Wine/Proton types, constructing
+        the identifier as Winlator would.
+        """
+        if profile_type not in ('Wine', 'Proton'):
+            return
+
+        identifier = WineInfoValidator.construct_identifier(profile_type, version_name)
+
+        is_valid, parsed = WineInfoValidator.validate_identifier(identifier)
+        if not is_valid:
+            errors.append(
+                f"versionName '{version_name}' (identifier: '{identifier}') does not match "
+                f"WineInfo pattern: {WineInfoValidator.PATTERN.pattern}"
+            )
+
+
+# profile.json structural rules, mirroring the hand-rolled checks in
+# ContentProfileValidator.validate_profile. Compiled once at import time
+# when fastjsonschema is available; the generated function replaces the
+# branch-heavy per-field Python loop.
+_PROFILE_SCHEMA = {
+    'type': 'object',
+    'required': ContentProfileValidator.REQUIRED_FIELDS,
+    'properties': {
+        'type': {'enum': ContentProfileValidator.VALID_TYPES},
+        'versionCode': {
+            'anyOf': [{'type': 'number'}, {'type': 'string', 'pattern': '^-?[0-9]+$'}],
+        },
+        'files': {'type': 'array'},
+    },
+    'allOf': [
+        {
+            'if': {'required': ['type'], 'properties': {'type': {'const': 'Wine'}}},
+            'then': {
+                'required': ['wine'],
+                'properties': {
+                    'wine': {'type': 'object', 'required': ['binPath', 'libPath', 'prefixPack']},
+                },
+            },
+        },
+        {
+            'if': {'required': ['type'], 'properties': {'type': {'const': 'Proton'}}},
+            'then': {
+                'required': ['proton'],
+                'properties': {
+                    'proton': {'type': 'object', 'required': ['binPath', 'libPath', 'prefixPack']},
+                },
+            },
+        },
+    ],
+}
+
+if fastjsonschema is not None:
+    _schema_validate = fastjsonschema.compile(_PROFILE_SCHEMA, use_default=False)
+else:
+    _schema_validate = None
+
+
+@dataclass(slots=True)
+class ProfilePaths:
+    """
+    Extraction-root-resolved paths from a Wine/Proton profile section,
+    built once at profile-validation time so the later steps reuse them
+    instead of re-joining the JSON strings against the temp root.
+    """
+    section: str
+    bin_raw: str
+    lib_raw: str
+    prefix_raw: str
+    bin: Path
+    lib: Path
+    prefix: Path
+
+
+@dataclass(slots=True)
+class ValidationState:
+    """
+    Mutable state shared by the validation step functions.
+
+    Slots drop the per-instance __dict__ and make the repeated
+    errors/warnings/temp_root attribute loads cheaper in the hot steps.
+    """
+    wcp_path: Path
+    temp_dir: str
+    temp_root: Path
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    file_cache: Dict[str, bytes] = field(default_factory=dict)
+    # Step output is buffered here and flushed in one write at the end,
+    # instead of one write() syscall per print on the hot path.
+    log: io.StringIO = field(default_factory=io.StringIO)
+
+
+def _extract_wcp(state: ValidationState) -> bool:
+    """Extract WCP archive (tar with xz or zstd compression)."""
+    log = state.log
+    log.write("\n[1/6] Extracting WCP archive...\n")
+
+    errors = state.errors
+
+    try:
+        # Try zstd first (current format). Decompress in-process and
+        # stream into tarfile to avoid forking out to tar; the 1 MiB
+        # read buffer amortizes syscall and decompression-block cost.
+        if zstandard is not None:
+            try:
+                with open(state.wcp_path, 'rb') as f:
+                    dctx = zstandard.ZstdDecompressor()
+                    with dctx.stream_reader(f, read_size=1 << 20) as reader:
+                        with tarfile.open(fileobj=reader, mode='r|',
+                                          copybufsize=_COPY_BUFSIZE) as tar:
+                            # numeric_owner skips per-member pwd/grp lookups
+                            tar.extractall(state.temp_dir, numeric_owner=True)
+                log.write("  ✓ Extracted with zstd compression\n")
+                return True
+            except (zstandard.ZstdError, tarfile.ReadError):
+                pass
+        else:
+            # Without the zstandard module, fall back to a zstd-capable
+            # system tar (CI installs the zstd CLI but not the binding)
+            try:
+                result = subprocess.run(
+                    ['tar', '--zstd', '-xf', str(state.wcp_path), '-C', state.temp_dir],
+                    capture_output=True,
+                    text=True,
+                    timeout=60
+                )
+                if result.returncode == 0:
+                    log.write("  ✓ Extracted with zstd compression\n")
+                    return True
+            except (subprocess.SubprocessError, FileNotFoundError):
+                pass
+
+        # Try xz fallback
+        try:
+            with tarfile.open(state.wcp_path, 'r:xz',
+                              copybufsize=_COPY_BUFSIZE) as tar:
+                tar.extractall(state.temp_dir, numeric_owner=True)
+            log.write("  ✓ Extracted with xz compression\n")
+            state.warnings.append("WCP uses xz compression, should use zstd")
+            return True
+        except tarfile.ReadError:
+            pass
+
+        errors.append("Failed to extract WCP archive (tried zstd and xz)")
+        return False
+
+    except Exception as e:
+        errors.append(f"Error extracting WCP: {e}")
+        return False
+
+
+def _extract_profile_only(state: ValidationState) -> Optional[bytes]:
+    """
+    Stream the archive and return profile.json's bytes without extracting
+    anything else - the fast path for callers that only need metadata.
+
+    Returns None either when profile.json is absent or when the archive
+    cannot be read at all; the latter case records its own error on the
+    state so the two are distinguishable.
+    """
+    def _find(tar):
+        for member in tar:
+            if member.name in ('profile.json', './profile.json'):
+                fileobj = tar.extractfile(member)
+                return fileobj.read() if fileobj is not None else None
+        return None
+
+    try:
+        if zstandard is not None:
+            try:
+                with open(state.wcp_path, 'rb') as f:
+                    dctx = zstandard.ZstdDecompressor()
+                    with dctx.stream_reader(f, read_size=1 << 20) as reader:
+                        with tarfile.open(fileobj=reader, mode='r|') as tar:
+                            return _find(tar)
+            except (zstandard.ZstdError, tarfile.ReadError):
+                pass
+        else:
+            # Without the zstandard module, mirror _extract_wcp and use a
+            # zstd-capable system tar, capturing just the member's bytes
+            # over stdout
+            try:
+                for member in ('profile.json', './profile.json'):
+                    result = subprocess.run(
+                        ['tar', '--zstd', '-xOf', str(state.wcp_path), member],
+                        capture_output=True,
+                        timeout=60
+                    )
+                    if result.returncode == 0:
+                        return result.stdout
+                # Both names failed: if tar can list the archive it is
+                # readable and profile.json is genuinely absent
+                listing = subprocess.run(
+                    ['tar', '--zstd', '-tf', str(state.wcp_path)],
+                    capture_output=True,
+                    timeout=60
+                )
+                if listing.returncode == 0:
+                    return None
+            except (subprocess.SubprocessError, FileNotFoundError):
+                pass
+
+        with tarfile.open(state.wcp_path, 'r|xz') as tar:
+            return _find(tar)
+    except (OSError, tarfile.TarError) as e:
+        state.errors.append(f"Error reading WCP archive: {e}")
+        return None
+
+
+def _check_profile_exists(state: ValidationState) -> bool:
+    """Check if profile.json exists."""
+    state.log.write("\n[2/6] Checking profile.json existence...\n")
+
+    if _stat_kind(os.path.join(state.temp_dir, 'profile.json')) == 'missing':
+        state.errors.append("profile.json not found at archive root")
+        return False
+
+    state.log.write("  ✓ profile.json found\n")
+    return True
+
+
+def _validate_profile_structure(state: ValidationState) -> Optional[Tuple[dict, Optional[ProfilePaths]]]:
+    """Validate profile.json structure and precompute section paths."""
+    log = state.log
+    log.write("\n[3/6] Validating profile.json structure...\n")
+
+    errors = state.errors
+    profile_path = state.temp_root / 'profile.json'
+
+    try:
+        raw = state.file_cache.get(str(profile_path))
+        if raw is None:
+            raw = profile_path.read_bytes()
+        profile_data = _json.loads(raw)
+    except ValueError as e:
+        errors.append(f"Invalid JSON in profile.json: {e}")
+        return None
+    except Exception as e:
+        errors.append(f"Error reading profile.json: {e}")
+        return None
+
+    # Validate structure
+    is_valid, profile_errors = ContentProfileValidator.validate_profile(profile_data)
+
+    if not is_valid:
+        errors.extend(profile_errors)
+        return None
+
+    log.write(f"  ✓ Type: {profile_data['type']}\n")
+    log.write(f"  ✓ Version Name: {profile_data['versionName']}\n")
+    log.write(f"  ✓ Version Code: {profile_data['versionCode']}\n")
+
+    # Show the resolved identifier
+    identifier = WineInfoValidator.construct_identifier(
+        profile_data['type'],
+        profile_data['versionName']
+    )
+    log.write(f"  ✓ Resolved identifier: {identifier}\n")
+
+    # Resolve the section paths once; steps 4 and 5 consume them as-is.
+    # Validation above guarantees the section and its keys exist.
+    paths = None
+    profile_type = profile_data['type']
+    if profile_type in ('Wine', 'Proton'):
+        section = profile_data['wine' if profile_type == 'Wine' else 'proton']
+        temp_root = state.temp_root
+        paths = ProfilePaths(
+            section='wine' if profile_type == 'Wine' else 'proton',
+            bin_raw=section['binPath'],
+            lib_raw=section['libPath'],
+            prefix_raw=section['prefixPack'],
+            bin=temp_root / section['binPath'],
+            lib=temp_root / section['libPath'],
+            prefix=temp_root / section['prefixPack'],
+        )
+
+    return profile_data, paths
+
+
+def _validate_wine_proton_files(state: ValidationState, profile_data: dict,
+                                paths: Optional[ProfilePaths]) -> bool:
+    """Validate Wine/Proton specific file requirements."""
+    log = state.log
+    log.write("\n[4/6] Validating Wine/Proton file structure...\n")
+
+    if paths is None:
+        log.write(f"  - Skipping (type={profile_data['type']}, not Wine/Proton)\n")
+        return True
+
+    errors = state.errors
+    section_key = paths.section
+
+    # Check bin directory
+    if _stat_kind(paths.bin) != 'dir':
+        errors.append(f"{section_key}.binPath '{paths.bin_raw}' is not a directory")
+    else:
+        log.write(f"  ✓ {paths.bin_raw}/ exists\n")
+
+    # Check lib directory
+    if _stat_kind(paths.lib) != 'dir':
+        errors.append(f"{section_key}.libPath '{paths.lib_raw}' is not a directory")
+    else:
+        log.write(f"  ✓ {paths.lib_raw}/ exists\n")
+
+    # Check prefixPack file
+    if _stat_kind(paths.prefix) != 'file':
+        errors.append(f"{section_key}.prefixPack '{paths.prefix_raw}' is not a file")
+    else:
+        log.write(f"  ✓ {paths.prefix_raw} exists\n")
+
+    return len(errors) == 0
+
+
+def _validate_prefix_pack(state: ValidationState, profile_data: dict,
+                          paths: Optional[ProfilePaths]) -> bool:
+    """Validate prefixPack.txz structure."""
+    log = state.log
+    log.write("\n[5/6] Validating prefixPack structure...\n")
+
+    if paths is None:
+        log.write(f"  - Skipping (type={profile_data['type']})\n")
+        return True
+
+    errors = state.errors
+    prefix_pack = paths.prefix_raw
+
+    prefix_file = paths.prefix
+    if not prefix_file.exists():
+        # Already reported in previous step
+        return False
+
+    # Fail fast on truncated or mislabelled packs: checking the size and
+    # the 6-byte xz magic is far cheaper than spinning up the xz decoder
+    # just to have it error out.
+    try:
+        if os.stat(prefix_file).st_size <= 32:
+            errors.append(f"prefixPack '{prefix_pack}' is truncated")
+            return False
+        with open(prefix_file, 'rb') as f:
+            magic = f.read(6)
+    except OSError as e:
+        errors.append(f"Error reading prefixPack.txz: {e}")
+        return False
+
+    if magic != b'\xfd7zXZ\x00':
+        errors.append(f"prefixPack '{prefix_pack}' is not an xz archive")
+        return False
+
+    try:
+        # Stream the tar single-pass instead of materializing every
+        # TarInfo via getmembers() - keeps memory flat on large prefixes.
+        with tarfile.open(prefix_file, 'r|xz') as tar:
+            count = 0
+            has_wine_prefix = False
+            missing_prefix = []
+
+            # attrgetter dispatches the .name load in C, saving a Python
+            # LOAD_ATTR per entry in the member sweep
+            for name in map(operator.attrgetter('name'), tar):
+                count += 1
+
+                # Classify with C-level string ops instead of slicing a
+                # normalized copy per entry: names are either '.wine/...'
+                # (possibly './'-prefixed), the root marker, or stray.
+                if name.startswith(('.wine/', './.wine/')):
+                    has_wine_prefix = True
+                elif name in ('', '.', './'):
+                    # Skip the root directory marker
+                    continue
+                elif len(missing_prefix) < 5:
+                    missing_prefix.append(name)
+
+            if count == 0:
+                state.warnings.append("prefixPack.txz is empty")
+                log.write("  ⚠ prefixPack is empty (may be valid for some use cases)\n")
+                return True
+
+            if not has_wine_prefix and missing_prefix:
                 errors.append(
-                    f"versionName '{version_name}' (identifier: '{identifier}') does not match "
-                    f"WineInfo pattern: {WineInfoValidator.PATTERN.pattern}"
+                    f"prefixPack must extract to .wine/ subdirectory. "
+                    f"Found paths without .wine/ prefix: {missing_prefix[:5]}"
                 )
-        
-        return len(errors) == 0, errors
+                return False
+
+            log.write(f"  ✓ Contains {count} files/directories\n")
+            log.write(f"  ✓ All paths correctly prefixed with .wine/\n")
+
+    except Exception as e:
+        errors.append(f"Error reading prefixPack.txz: {e}")
+        return False
+
+    return True
+
+
+def _validate_directory_structure(state: ValidationState) -> bool:
+    """Validate overall directory structure."""
+    log = state.log
+    log.write("\n[6/6] Validating overall WCP structure...\n")
+
+    errors = state.errors
+    warnings = state.warnings
+
+    # One scandir pass over the root replaces the ~15 individual
+    # exists()/is_dir() stat calls; DirEntry type info comes straight
+    # from the directory listing.
+    root_entries = {e.name: e for e in os.scandir(state.temp_dir)}
+
+    # Check required files
+    if 'profile.json' not in root_entries:
+        errors.append("Missing required file at root: profile.json")
+
+    # Check expected directories (warnings only)
+    for dirname in ['bin', 'lib', 'share']:
+        entry = root_entries.get(dirname)
+        if entry is None or not entry.is_dir(follow_symlinks=False):
+            warnings.append(f"Expected directory not found: {dirname}/")
+        else:
+            log.write(f"  ✓ {dirname}/ exists\n")
+
+    # Check for wcp.json (optional but expected)
+    if 'wcp.json' in root_entries:
+        log.write(f"  ✓ wcp.json exists (optional)\n")
+        try:
+            raw = state.file_cache.get(root_entries['wcp.json'].path)
+            if raw is None:
+                with open(root_entries['wcp.json'].path, 'rb') as f:
+                    raw = f.read()
+            wcp_data = _json.loads(raw)
+            log.write(f"    - name: {wcp_data.get('name')}\n")
+            log.write(f"    - version: {wcp_data.get('version')}\n")
+        except Exception as e:
+            warnings.append(f"Could not parse wcp.json: {e}")
+
+    # Check for critical Wine binaries in bin/
+    bin_entry = root_entries.get('bin')
+    if bin_entry is not None and bin_entry.is_dir(follow_symlinks=False):
+        critical_binaries = ['wine', 'wine64', 'wineserver']
+        bin_names = {e.name for e in os.scandir(bin_entry.path)}
+        found_binaries = [b for b in critical_binaries if b in bin_names]
+
+        if found_binaries:
+            log.write(f"  ✓ Found Wine binaries: {', '.join(found_binaries)}\n")
+        else:
+            warnings.append(
+                f"No critical Wine binaries found in bin/ "
+                f"(expected at least one of: {', '.join(critical_binaries)})"
+            )
+
+    # Check for Wine libraries in lib/
+    lib_entry = root_entries.get('lib')
+    if lib_entry is not None and lib_entry.is_dir(follow_symlinks=False):
+        lib_entries = {e.name: e for e in os.scandir(lib_entry.path)}
+        found_wine_libs = False
+        for subdir in ['wine', 'wine64']:
+            wine_lib_entry = lib_entries.get(subdir)
+            if wine_lib_entry is not None and wine_lib_entry.is_dir(follow_symlinks=False):
+                # Check if it has any files
+                lib_files = os.listdir(wine_lib_entry.path)
+                if lib_files:
+                    found_wine_libs = True
+                    log.write(f"  ✓ Found Wine libraries in lib/{subdir}/ ({len(lib_files)} items)\n")
+                    break
+
+        if not found_wine_libs:
+            warnings.append(
+                "No Wine library directories found in lib/ "
+                "(expected lib/wine/ or lib/wine64/)"
+            )
+
+    return len(errors) == 0
 
 
 class WCPValidator:
     """
     Main WCP package validator that simulates Winlator's container startup validation.
+
+    Thin context manager: it owns the temp dir and the ValidationState;
+    the actual validation steps are module-level functions over that state.
     """
-    
+
     def __init__(self, wcp_path: str):
         self.wcp_path = Path(wcp_path)
         self.temp_dir = None
+        self._tmp_ctx = None
+        self._state = None
         self.errors = []
         self.warnings = []
-    
+
     def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp(prefix='wcp_test_')
+        self._tmp_ctx = tempfile.TemporaryDirectory(prefix='wcp_test_')
+        self.temp_dir = self._tmp_ctx.name
+        # The step functions share the errors/warnings lists via the state.
+        self._state = ValidationState(
+            wcp_path=self.wcp_path,
+            temp_dir=self.temp_dir,
+            temp_root=Path(self.temp_dir),
+            errors=self.errors,
+            warnings=self.warnings,
+        )
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            import shutil
-            shutil.rmtree(self.temp_dir)
-    
-    def validate(self) -> bool:
+        if self._tmp_ctx is not None:
+            self._tmp_ctx.cleanup()
+            self._tmp_ctx = None
+
+    def validate(self, lazy: bool = False) -> bool:
         """
-        Run all validation checks.
-        
+        Run validation checks.
+
+        With lazy=True only profile.json is streamed out of the archive
+        and validated - for callers that just list package metadata - and
+        the full extraction and structure checks are skipped.
+
         Returns:
             True if all validations pass, False otherwise
         """
+        state = self._state
+
         if not self.wcp_path.exists():
             self.errors.append(f"WCP file not found: {self.wcp_path}")
             return False
-        
-        print(f"Validating WCP: {self.wcp_path}")
-        print(f"Extraction directory: {self.temp_dir}")
-        
+
+        state.log.write(f"Validating WCP: {self.wcp_path}\n")
+        state.log.write(f"Extraction directory: {self.temp_dir}\n")
+
+        if lazy:
+            raw = _extract_profile_only(state)
+            if raw is None:
+                # An unreadable archive already reported its own error
+                if not self.errors:
+                    self.errors.append("profile.json not found in WCP archive")
+                return False
+            # Seed the cache so the structure step parses the streamed bytes
+            state.file_cache[str(state.temp_root / 'profile.json')] = raw
+            return _validate_profile_structure(state) is not None
+
         # Step 1: Extract WCP archive (simulates TarCompressorUtils.extract)
-        if not self._extract_wcp():
+        if not _extract_wcp(state):
             return False
-        
+
+        # Batch-read the small metadata files up front; later steps parse
+        # from memory instead of issuing their own open/read round-trips.
+        state.file_cache = _batch_read_small_files([
+            os.path.join(self.temp_dir, 'profile.json'),
+            os.path.join(self.temp_dir, 'wcp.json'),
+        ])
+
         # Step 2: Validate profile.json exists (simulates ContentsManager.readProfile check)
-        if not self._check_profile_exists():
+        if not _check_profile_exists(state):
             return False
-        
+
         # Step 3: Validate profile.json structure (simulates ContentsManager.readProfile)
-        profile_data = self._validate_profile_structure()
-        if not profile_data:
+        result = _validate_profile_structure(state)
+        if result is None:
             return False
-        
+        profile_data, profile_paths = result
+
         # Step 4: Validate Wine/Proton specific requirements
-        if not self._validate_wine_proton_files(profile_data):
+        if not _validate_wine_proton_files(state, profile_data, profile_paths):
             return False
-        
+
         # Step 5: Validate prefixPack structure
-        if not self._validate_prefix_pack(profile_data):
+        if not _validate_prefix_pack(state, profile_data, profile_paths):
             return False
-        
+
         # Step 6: Additional file structure checks
-        if not self._validate_directory_structure():
-            return False
-        
-        return len(self.errors) == 0
-    
-    def _extract_wcp(self) -> bool:
-        """Extract WCP archive (tar with xz or zstd compression)."""
-        print("\n[1/6] Extracting WCP archive...")
-        
-        try:
-            # Try zstd first (current format)
-            try:
-                result = subprocess.run(
-                    ['tar', '--zstd', '-xf', str(self.wcp_path), '-C', self.temp_dir],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                if result.returncode == 0:
-                    print("  ✓ Extracted with zstd compression")
-                    return True
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
-            
-            # Try xz fallback
-            try:
-                result = subprocess.run(
-                    ['tar', '-xJf', str(self.wcp_path), '-C', self.temp_dir],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
-                )
-                if result.returncode == 0:
-                    print("  ✓ Extracted with xz compression")
-                    self.warnings.append("WCP uses xz compression, should use zstd")
-                    return True
-            except (subprocess.SubprocessError, FileNotFoundError):
-                pass
-            
-            self.errors.append("Failed to extract WCP archive with tar (tried zstd and xz)")
+        if not _validate_directory_structure(state):
             return False
-            
-        except Exception as e:
-            self.errors.append(f"Error extracting WCP: {e}")
-            return False
-    
-    def _check_profile_exists(self) -> bool:
-        """Check if profile.json exists."""
-        print("\n[2/6] Checking profile.json existence...")
-        
-        profile_path = Path(self.temp_dir) / 'profile.json'
-        if not profile_path.exists():
-            self.errors.append("profile.json not found at archive root")
-            return False
-        
-        print(f"  ✓ profile.json found")
-        return True
-    
-    def _validate_profile_structure(self) -> Optional[dict]:
-        """Validate profile.json structure."""
-        print("\n[3/6] Validating profile.json structure...")
-        
-        profile_path = Path(self.temp_dir) / 'profile.json'
-        
-        try:
-            with open(profile_path, 'r') as f:
-                profile_data = json.load(f)
-        except json.JSONDecodeError as e:
-            self.errors.append(f"Invalid JSON in profile.json: {e}")
-            return None
-        except Exception as e:
-            self.errors.append(f"Error reading profile.json: {e}")
-            return None
-        
-        # Validate structure
-        is_valid, errors = ContentProfileValidator.validate_profile(profile_data)
-        
-        if not is_valid:
-            self.errors.extend(errors)
-            return None
-        
-        print(f"  ✓ Type: {profile_data['type']}")
-        print(f"  ✓ Version Name: {profile_data['versionName']}")
-        print(f"  ✓ Version Code: {profile_data['versionCode']}")
-        
-        # Show the resolved identifier
-        identifier = WineInfoValidator.construct_identifier(
-            profile_data['type'],
-            profile_data['versionName']
-        )
-        print(f"  ✓ Resolved identifier: {identifier}")
-        
-        return profile_data
-    
-    def _validate_wine_proton_files(self, profile_data: dict) -> bool:
-        """Validate Wine/Proton specific file requirements."""
-        print("\n[4/6] Validating Wine/Proton file structure...")
-        
-        profile_type = profile_data['type']
-        
-        if profile_type not in ['Wine', 'Proton']:
-            print(f"  - Skipping (type={profile_type}, not Wine/Proton)")
-            return True
-        
-        section_key = 'wine' if profile_type == 'Wine' else 'proton'
-        section_data = profile_data.get(section_key, {})
-        
-        bin_path = section_data.get('binPath')
-        lib_path = section_data.get('libPath')
-        prefix_pack = section_data.get('prefixPack')
-        
-        # Check bin directory
-        bin_dir = Path(self.temp_dir) / bin_path
-        if not bin_dir.exists() or not bin_dir.is_dir():
-            self.errors.append(f"{section_key}.binPath '{bin_path}' is not a directory")
-        else:
-            print(f"  ✓ {bin_path}/ exists")
-        
-        # Check lib directory
-        lib_dir = Path(self.temp_dir) / lib_path
-        if not lib_dir.exists() or not lib_dir.is_dir():
-            self.errors.append(f"{section_key}.libPath '{lib_path}' is not a directory")
-        else:
-            print(f"  ✓ {lib_path}/ exists")
-        
-        # Check prefixPack file
-        prefix_file = Path(self.temp_dir) / prefix_pack
-        if not prefix_file.exists() or not prefix_file.is_file():
-            self.errors.append(f"{section_key}.prefixPack '{prefix_pack}' is not a file")
-        else:
-            print(f"  ✓ {prefix_pack} exists")
-        
-        return len(self.errors) == 0
-    
-    def _validate_prefix_pack(self, profile_data: dict) -> bool:
-        """Validate prefixPack.txz structure."""
-        print("\n[5/6] Validating prefixPack structure...")
-        
-        profile_type = profile_data['type']
-        
-        if profile_type not in ['Wine', 'Proton']:
-            print(f"  - Skipping (type={profile_type})")
-            return True
-        
-        section_key = 'wine' if profile_type == 'Wine' else 'proton'
-        section_data = profile_data.get(section_key, {})
-        prefix_pack = section_data.get('prefixPack')
-        
-        prefix_file = Path(self.temp_dir) / prefix_pack
-        if not prefix_file.exists():
-            # Already reported in previous step
-            return False
-        
-        try:
-            with tarfile.open(prefix_file, 'r:xz') as tar:
-                members = tar.getmembers()
-                
-                if not members:
-                    self.warnings.append("prefixPack.txz is empty")
-                    print("  ⚠ prefixPack is empty (may be valid for some use cases)")
-                    return True
-                
-                # Check that all paths start with .wine/
-                has_wine_prefix = False
-                missing_prefix = []
-                
-                for member in members:
-                    # Normalize paths - remove leading './' if present
-                    normalized_name = member.name
-                    if normalized_name.startswith('./'):
-                        normalized_name = normalized_name[2:]
-                    
-                    # Skip the root directory marker
-                    if normalized_name == '' or normalized_name == '.':
-                        continue
-                    
-                    if normalized_name.startswith('.wine/'):
-                        has_wine_prefix = True
-                    else:
-                        missing_prefix.append(member.name)
-                
-                if not has_wine_prefix and missing_prefix:
-                    self.errors.append(
-                        f"prefixPack must extract to .wine/ subdirectory. "
-                        f"Found paths without .wine/ prefix: {missing_prefix[:5]}"
-                    )
-                    return False
-                
-                print(f"  ✓ Contains {len(members)} files/directories")
-                print(f"  ✓ All paths correctly prefixed with .wine/")
-                
-        except Exception as e:
-            self.errors.append(f"Error reading prefixPack.txz: {e}")
-            return False
-        
-        return True
-    
-    def _validate_directory_structure(self) -> bool:
-        """Validate overall directory structure."""
-        print("\n[6/6] Validating overall WCP structure...")
-        
-        required_at_root = ['profile.json']
-        expected_dirs = ['bin', 'lib', 'share']
-        
-        # Check required files
-        for filename in required_at_root:
-            file_path = Path(self.temp_dir) / filename
-            if not file_path.exists():
-                self.errors.append(f"Missing required file at root: {filename}")
-        
-        # Check expected directories (warnings only)
-        for dirname in expected_dirs:
-            dir_path = Path(self.temp_dir) / dirname
-            if not dir_path.exists():
-                self.warnings.append(f"Expected directory not found: {dirname}/")
-            else:
-                print(f"  ✓ {dirname}/ exists")
-        
-        # Check for wcp.json (optional but expected)
-        wcp_json = Path(self.temp_dir) / 'wcp.json'
-        if wcp_json.exists():
-            print(f"  ✓ wcp.json exists (optional)")
-            try:
-                with open(wcp_json, 'r') as f:
-                    wcp_data = json.load(f)
-                    print(f"    - name: {wcp_data.get('name')}")
-                    print(f"    - version: {wcp_data.get('version')}")
-            except Exception as e:
-                self.warnings.append(f"Could not parse wcp.json: {e}")
-        
-        # Check for critical Wine binaries in bin/
-        bin_dir = Path(self.temp_dir) / 'bin'
-        if bin_dir.exists():
-            critical_binaries = ['wine', 'wine64', 'wineserver']
-            found_binaries = []
-            for binary in critical_binaries:
-                if (bin_dir / binary).exists():
-                    found_binaries.append(binary)
-            
-            if found_binaries:
-                print(f"  ✓ Found Wine binaries: {', '.join(found_binaries)}")
-            else:
-                self.warnings.append(
-                    f"No critical Wine binaries found in bin/ "
-                    f"(expected at least one of: {', '.join(critical_binaries)})"
-                )
-        
-        # Check for Wine libraries in lib/
-        lib_dir = Path(self.temp_dir) / 'lib'
-        if lib_dir.exists():
-            wine_subdirs = ['wine', 'wine64']
-            found_wine_libs = False
-            for subdir in wine_subdirs:
-                wine_lib_dir = lib_dir / subdir
-                if wine_lib_dir.exists() and wine_lib_dir.is_dir():
-                    # Check if it has any files
-                    lib_files = list(wine_lib_dir.iterdir())
-                    if lib_files:
-                        found_wine_libs = True
-                        print(f"  ✓ Found Wine libraries in lib/{subdir}/ ({len(lib_files)} items)")
-                        break
-            
-            if not found_wine_libs:
-                self.warnings.append(
-                    "No Wine library directories found in lib/ "
-                    "(expected lib/wine/ or lib/wine64/)"
-                )
-        
+
         return len(self.errors) == 0
-    
-    def print_results(self):
-        """Print validation results."""
-        print("\n" + "="*70)
-        print("VALIDATION RESULTS")
-        print("="*70)
-        
+
+    def print_results(self, quiet: bool = False):
+        """Print validation results, flushing the buffered step log once.
+
+        With quiet=True the per-step log is discarded and only the
+        results summary is written.
+        """
+        out = io.StringIO() if quiet or self._state is None else self._state.log
+
+        out.write("\n" + "="*70 + "\n")
+        out.write("VALIDATION RESULTS\n")
+        out.write("="*70 + "\n")
+
         if self.warnings:
-            print(f"\n⚠ WARNINGS ({len(self.warnings)}):")
+            out.write(f"\n⚠ WARNINGS ({len(self.warnings)}):\n")
             for warning in self.warnings:
-                print(f"  - {warning}")
-        
+                out.write(f"  - {warning}\n")
+
         if self.errors:
-            print(f"\n✗ ERRORS ({len(self.errors)}):")
+            out.write(f"\n✗ ERRORS ({len(self.errors)}):\n")
             for error in self.errors:
-                print(f"  - {error}")
-            print(f"\n❌ VALIDATION FAILED")
-            return False
+                out.write(f"  - {error}\n")
+            out.write("\n❌ VALIDATION FAILED\n")
+            success = False
         else:
-            print(f"\n✓ ALL VALIDATIONS PASSED")
-            print(f"  This WCP package should work correctly with coffincolors/winlator")
-            return True
+            out.write("\n✓ ALL VALIDATIONS PASSED\n")
+            out.write("  This WCP package should work correctly with coffincolors/winlator\n")
+            success = True
+
+        # One write()+flush() for the whole run instead of one per print
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+        return success
+
+
+def _validate_one(wcp_file: str) -> Tuple[str, bool, List[str], List[str]]:
+    """Worker: validate a single WCP and return its results."""
+    with WCPValidator(wcp_file) as validator:
+        success = validator.validate()
+        return wcp_file, success, validator.errors, validator.warnings
+
+
+def main_many(wcp_files: List[str], quiet: bool = False, as_json: bool = False) -> int:
+    """
+    Validate several WCPs in parallel, one process per package.
+
+    Each validation is CPU-bound on JSON parse and tar decode, so
+    processes scale where threads would serialize on the GIL. With
+    as_json=True each package emits one JSON line instead of the text
+    summary; quiet=True drops the per-package warning/error detail.
+    """
+    import concurrent.futures
+
+    failures = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for wcp_file, success, errors, warnings in pool.map(_validate_one, wcp_files):
+            if as_json:
+                _dump_json_line({
+                    'file': wcp_file,
+                    'errors': errors,
+                    'warnings': warnings,
+                    'success': success,
+                })
+            else:
+                print(f"[{'OK' if success else 'FAIL'}] {wcp_file}")
+                if not quiet:
+                    for warning in warnings:
+                        print(f"  ⚠ {warning}")
+                    for error in errors:
+                        print(f"  ✗ {error}")
+            if not success:
+                failures += 1
+
+    if not as_json:
+        print(f"\n{len(wcp_files) - failures}/{len(wcp_files)} packages passed")
+    return 1 if failures else 0
+
+
+def _dump_json_line(payload: dict) -> None:
+    """
+    Write payload as one JSON line of bytes on stdout.
+
+    orjson.dumps already returns bytes, so they go straight to
+    sys.stdout.buffer without a str round-trip; the stdlib fallback
+    encodes once.
+    """
+    if hasattr(_json, 'OPT_APPEND_NEWLINE'):
+        data = _json.dumps(payload, option=_json.OPT_APPEND_NEWLINE)
+    else:
+        data = (_json.dumps(payload) + '\n').encode('utf-8')
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: test_wcp_integration.py <wcp_file>")
+    argv = sys.argv[1:]
+    quiet = '--quiet' in argv
+    as_json = '--json' in argv
+    args = [a for a in argv if a not in ('--quiet', '--json')]
+
+    if len(args) < 1:
+        print("Usage: test_wcp_integration.py [--quiet] [--json] <wcp_file> [<wcp_file> ...]")
         print("\nThis script validates WCP packages against coffincolors/winlator requirements.")
         sys.exit(1)
-    
-    wcp_file = sys.argv[1]
-    
-    print("="*70)
-    print("Winlator WCP Integration Test")
-    print("Based on coffincolors/winlator container startup validation")
-    print("="*70)
-    
+
+    # Batch mode: validate packages in parallel worker processes
+    if len(args) > 1:
+        sys.exit(main_many(args, quiet=quiet, as_json=as_json))
+
+    wcp_file = args[0]
+
+    if not quiet and not as_json:
+        print("="*70)
+        print("Winlator WCP Integration Test")
+        print("Based on coffincolors/winlator container startup validation")
+        print("="*70)
+
     with WCPValidator(wcp_file) as validator:
         success = validator.validate()
-        validator.print_results()
-        
+
+        if as_json:
+            _dump_json_line({
+                'errors': validator.errors,
+                'warnings': validator.warnings,
+                'success': success,
+            })
+        else:
+            validator.print_results(quiet=quiet)
+
         sys.exit(0 if success else 1)
 
 